@@ -13,11 +13,12 @@ Date: 2025-07-25
 
 import os
 import sys
-import json
 import logging
 import glob
 from pathlib import Path
 
+import msgspec
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -54,8 +55,8 @@ def process_single_file(json_file_path: str, tables_folder: str = TABLES_FOLDER,
         processor = HTMLTableProcessor(openai_client=None)
         
         # Load the JSON document
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file_path, 'rb') as f:
+            data = msgspec.json.decode(f.read())
         
         tables_processed = 0
         
@@ -111,8 +112,8 @@ def process_single_file(json_file_path: str, tables_folder: str = TABLES_FOLDER,
         
         # Save the updated JSON if any tables were processed
         if tables_processed > 0:
-            with open(json_file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(json_file_path, 'wb') as f:
+                f.write(msgspec.json.format(msgspec.json.encode(data), indent=2))
             
             logger.info(f"✅ Processed {tables_processed} table sections in {Path(json_file_path).name}")
         else:
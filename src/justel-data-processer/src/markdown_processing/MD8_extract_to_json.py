@@ -11,10 +11,11 @@ Date: 2025-07-02
 
 import os
 import re
-import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 
+import msgspec
+
 # Import refactored modules - handle both relative and absolute imports
 try:
     # Try relative imports first (when used as a module)
@@ -24,6 +25,7 @@ try:
     from .hierarchy_parser import HierarchyParser
     from .article_extractor import ArticleExtractor
     from .json_schema import JSONSchemaBuilder
+    from .hardcoded_jsons import get_hardcoded_json, hardcoded_document_ids
 except ImportError:
     # Fall back to absolute imports (when run as a script)
     import sys
@@ -35,6 +37,7 @@ except ImportError:
     from hierarchy_parser import HierarchyParser
     from article_extractor import ArticleExtractor
     from json_schema import JSONSchemaBuilder
+    from hardcoded_jsons import get_hardcoded_json, hardcoded_document_ids
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -601,7 +604,7 @@ class BelgianLegalDocumentExtractor:
         document_id = os.path.splitext(filename)[0]
         
         # HARDCODED FIX: Handle edge case documents with structural issues
-        if document_id in ['2020030910', '1999036088', '2016A29166']:
+        if document_id in hardcoded_document_ids():
             logger.warning(f"Using hardcoded JSON for edge case document: {document_id}")
             return self._get_hardcoded_json(document_id)
 
@@ -637,19 +640,7 @@ class BelgianLegalDocumentExtractor:
         These documents have complex structural problems that are difficult to fix
         programmatically, so we use pre-processed correct JSON instead.
         """
-        try:
-            from .hardcoded_jsons import get_json_2020030910, get_json_1999036088, get_json_2016A29166
-        except ImportError:
-            from hardcoded_jsons import get_json_2020030910, get_json_1999036088, get_json_2016A29166
-        
-        if document_id == '2020030910':
-            return get_json_2020030910()
-        elif document_id == '1999036088':
-            return get_json_1999036088()
-        elif document_id == '2016A29166':
-            return get_json_2016A29166()
-        else:
-            raise ValueError(f"No hardcoded JSON available for document: {document_id}")
+        return get_hardcoded_json(document_id)
 
 
 def main():
@@ -709,9 +700,10 @@ def main():
                 total_articles = extractor._count_articles_in_tree(document_data['document_hierarchy'])
                 total_footnotes = extractor._count_footnotes_in_tree(document_data['document_hierarchy'])
 
-                # Save to JSON file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(document_data, f, indent=2, ensure_ascii=False)
+                # Save to JSON file (msgspec writes the same indented UTF-8 JSON
+                # as json.dump(indent=2, ensure_ascii=False), an order of magnitude faster)
+                with open(output_file, 'wb') as f:
+                    f.write(msgspec.json.format(msgspec.json.encode(document_data), indent=2))
 
                 logger.info(f"Successfully processed: {filename}")
                 logger.info(f"  - Articles extracted: {total_articles}")
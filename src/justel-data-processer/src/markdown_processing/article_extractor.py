@@ -79,6 +79,49 @@ class ArticleExtractor:
         # Updated to support both WALLONNE (double N) and WALLONE (single N) variations
         self.regional_pattern = re.compile(r'\((?:REGION|R[éeÉE]gion)\s+(WALLON(?:N)?E?|FLAMANDE?|BRUXELLES-CAPITALE|DE\s+BRUXELLES-CAPITALE|BRUXELLOISE)\)', re.IGNORECASE)
 
+        # Footnote cleanup patterns, applied to the text of every article
+        # Footnote-style legal citations: (NUMBER)<TYPE [date](url), details>
+        self.footnote_legal_citation_pattern = re.compile(
+            r'\(\d+\)<(?:Inséré par\s+)?[A-Z]+\s+\[[^\]]+\]\([^)]+\)[^>]*(?:\*\*En vigueur\s*:\*\*[^>]*)?>',
+            re.IGNORECASE | re.DOTALL
+        )
+        # Belgian footnote patterns (including malformed patterns with HTML artifacts)
+        self.remaining_footnote_patterns = [re.compile(pattern) for pattern in (
+            # Format: [NUMBER content][NUMBER] - Belgian nested footnote format
+            r'\[(\d+)\s+([^\]]+)\]\1',
+            # Format: [NUMBER] content ][NUMBER] - Belgian spaced footnote format
+            r'\[(\d+)\]\s*([^\]]+)\]\[?\1\]?',
+            # Malformed footnote patterns with HTML/markdown artifacts - VERY SPECIFIC
+            r'\[(\d+)\]>"\)\s*([^,\]]{1,50}),?\]\[?\1?\]?>"\)',  # [1]>") content,][1]>") - limited content length
+            r'\[(\d+)\]>"\)\s*([^,\]]{1,30})',  # [1]>") content - limited content length
+            r'\]\[(\d+)\]>"\)',  # ][1]>") - exact pattern only
+            # Simple footnote references: [1], [2], etc.
+            r'\[(\d+)\]',
+            # Orphaned closing brackets with numbers: ]1, ]2, etc.
+            r'\](\d+)',
+            # Double brackets: ][NUMBER]
+            r'\]\[(\d+)\]',
+            # HTML/markdown artifacts - VERY SPECIFIC to avoid removing content
+            r'>"\)',  # Orphaned >") - exact pattern only
+        )]
+        # Orphaned brackets, extra spaces and formatting issues, with their replacement
+        self.orphaned_marker_patterns = [(re.compile(pattern), replacement) for pattern, replacement in (
+            # Multiple consecutive spaces
+            (r'\s{2,}', ' '),
+            # Orphaned closing brackets at start of text
+            (r'^\s*\]\s*', ''),
+            # Orphaned opening brackets at end of text
+            (r'\s*\[\s*$', ''),
+            # Empty bracket pairs
+            (r'\[\s*\]', ''),
+            # Spaces before punctuation
+            (r'\s+([.,:;!?])', r'\1'),
+            # Multiple newlines
+            (r'\n{3,}', '\n\n'),
+        )]
+        # Footnote reference markers like [NUMBER] or [NUMBER text]NUMBER
+        self.footnote_marker_pattern = re.compile(r'\[\d+[^\]]*\]\d*|\[\d+\s+[^\]]*\]\d+')
+
     def _extract_regional_suffix(self, article_content: str) -> str:
         """
         Extract regional suffix from article content to create unique article numbers.
@@ -1185,16 +1228,8 @@ c. ont été éliminés ;
         - Preceded by footnote numbers like (1)<L ...>
         - Not legitimate article modification notices
         """
-        import re
-
-        # Pattern for footnote-style legal citations: (NUMBER)<TYPE [date](url), details>
-        # This removes legal citations that are clearly footnote references
-        footnote_legal_citation_pattern = re.compile(
-            r'\(\d+\)<(?:Inséré par\s+)?[A-Z]+\s+\[[^\]]+\]\([^)]+\)[^>]*(?:\*\*En vigueur\s*:\*\*[^>]*)?>',
-            re.IGNORECASE | re.DOTALL
-        )
-
-        cleaned_text = footnote_legal_citation_pattern.sub('', text)
+        # Removes legal citations that are clearly footnote references
+        cleaned_text = self.footnote_legal_citation_pattern.sub('', text)
 
         if cleaned_text != text:
             logger.debug(f"✅ Removed footnote-style legal citation markers")
@@ -1218,9 +1253,10 @@ c. ont été éliminés ;
             pattern = ref.get("bracket_pattern", "")
             content = ref.get("referenced_text", "").strip()
 
-            if pattern and pattern in cleaned_text:
-                # Find the pattern in the text and check for proper spacing
-                pattern_start = cleaned_text.find(pattern)
+            # bracket_pattern is literal text: a single find() locates it, no regex needed
+            pattern_start = cleaned_text.find(pattern) if pattern else -1
+            if pattern_start >= 0:
+                # Check for proper spacing before the pattern
                 if pattern_start > 0:
                     # Check if there's a word character immediately before the pattern
                     preceding_char = cleaned_text[pattern_start - 1]
@@ -1235,7 +1271,7 @@ c. ont été éliminés ;
                     replacement = content
 
                 # Replace the footnote pattern with properly spaced content
-                cleaned_text = cleaned_text.replace(pattern, replacement, 1)
+                cleaned_text = cleaned_text[:pattern_start] + replacement + cleaned_text[pattern_start + len(pattern):]
                 successful_replacements += 1
                 logger.debug(f"✅ Cleaned known footnote pattern for ref {ref.get('reference_number', 'unknown')}")
 
@@ -1246,33 +1282,11 @@ c. ont été éliminés ;
         """
         Clean any remaining Belgian footnote patterns using comprehensive regex patterns.
         """
-        import re
-
         cleaned_text = text
         patterns_cleaned = 0
 
-        # Belgian footnote patterns to clean (including malformed patterns with HTML artifacts)
-        footnote_patterns = [
-            # Format: [NUMBER content][NUMBER] - Belgian nested footnote format
-            r'\[(\d+)\s+([^\]]+)\]\1',
-            # Format: [NUMBER] content ][NUMBER] - Belgian spaced footnote format
-            r'\[(\d+)\]\s*([^\]]+)\]\[?\1\]?',
-            # Malformed footnote patterns with HTML/markdown artifacts - VERY SPECIFIC
-            r'\[(\d+)\]>"\)\s*([^,\]]{1,50}),?\]\[?\1?\]?>"\)',  # [1]>") content,][1]>") - limited content length
-            r'\[(\d+)\]>"\)\s*([^,\]]{1,30})',  # [1]>") content - limited content length
-            r'\]\[(\d+)\]>"\)',  # ][1]>") - exact pattern only
-            # Simple footnote references: [1], [2], etc.
-            r'\[(\d+)\]',
-            # Orphaned closing brackets with numbers: ]1, ]2, etc.
-            r'\](\d+)',
-            # Double brackets: ][NUMBER]
-            r'\]\[(\d+)\]',
-            # HTML/markdown artifacts - VERY SPECIFIC to avoid removing content
-            r'>"\)',  # Orphaned >") - exact pattern only
-        ]
-
-        for pattern in footnote_patterns:
-            matches = list(re.finditer(pattern, cleaned_text))
+        for pattern in self.remaining_footnote_patterns:
+            matches = list(pattern.finditer(cleaned_text))
             if matches:
                 # Process matches from end to start to maintain positions
                 for match in reversed(matches):
@@ -1304,31 +1318,14 @@ c. ont été éliminés ;
         """
         Final cleanup of any orphaned brackets, extra spaces, and formatting issues.
         """
-        import re
-
         cleaned_text = text
 
         # Clean up orphaned brackets and markers
-        cleanup_patterns = [
-            # Multiple consecutive spaces
-            (r'\s{2,}', ' '),
-            # Orphaned closing brackets at start of text
-            (r'^\s*\]\s*', ''),
-            # Orphaned opening brackets at end of text
-            (r'\s*\[\s*$', ''),
-            # Empty bracket pairs
-            (r'\[\s*\]', ''),
-            # Spaces before punctuation
-            (r'\s+([.,:;!?])', r'\1'),
-            # Multiple newlines
-            (r'\n{3,}', '\n\n'),
-        ]
-
-        for pattern, replacement in cleanup_patterns:
+        for pattern, replacement in self.orphaned_marker_patterns:
             old_text = cleaned_text
-            cleaned_text = re.sub(pattern, replacement, cleaned_text)
+            cleaned_text = pattern.sub(replacement, cleaned_text)
             if old_text != cleaned_text:
-                logger.debug(f"✅ Applied cleanup pattern: {pattern}")
+                logger.debug(f"✅ Applied cleanup pattern: {pattern.pattern}")
 
         return cleaned_text.strip()
 
@@ -1426,8 +1423,9 @@ c. ont été éliminés ;
             content = ref["referenced_text"]
 
             # Try exact match first
-            if pattern in cleaned_text:
-                cleaned_text = cleaned_text.replace(pattern, content, 1)
+            pattern_start = cleaned_text.find(pattern)
+            if pattern_start >= 0:
+                cleaned_text = cleaned_text[:pattern_start] + content + cleaned_text[pattern_start + len(pattern):]
                 logger.debug(f"✅ Sequential replacement successful for footnote {ref['reference_number']}")
             else:
                 # Try fuzzy matching for slight variations
@@ -1445,7 +1443,4 @@ c. ont été éliminés ;
 
     def _still_has_footnote_markers(self, text: str) -> bool:
         """Check if text still contains footnote reference markers."""
-        import re
-        # Look for patterns like [NUMBER] or [NUMBER text]NUMBER
-        footnote_pattern = r'\[\d+[^\]]*\]\d*|\[\d+\s+[^\]]*\]\d+'
-        return bool(re.search(footnote_pattern, text))
+        return bool(self.footnote_marker_pattern.search(text))
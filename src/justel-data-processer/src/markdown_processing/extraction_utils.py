@@ -38,6 +38,9 @@ class ExtractionUtils:
             r'\((\d+)\)<(?:Inséré par\s+)?([A-Z]+)\s+\[([^\]]+)\]\(([^)]+)\),\s*([^;]+);\s*En vigueur\s*:\s*([^>]+)>'
         )
 
+        # URL in parentheses within a footnote citation, e.g. (https://www.ejustice.just.fgov.be/eli/...)
+        self.footnote_url_pattern = re.compile(r'\((https://www\.ejustice\.just\.fgov\.be/[^)]+)\)')
+
         # Article pattern - comprehensive regex to capture all article variations
         # Matches multiple formats with CASE-INSENSITIVE support for both Art. and art.:
         # 1. **ARTICLE**[Art.] [NUMBER]. (standard format with brackets)
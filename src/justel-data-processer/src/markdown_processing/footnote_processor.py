@@ -9,7 +9,6 @@ Author: Augment Agent
 Date: 2025-07-13
 """
 
-import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -77,8 +76,7 @@ class FootnoteProcessor:
         try:
             # Extract URL from footnote content using regex
             # Look for URLs in parentheses within the footnote content
-            url_pattern = r'\((https://www\.ejustice\.just\.fgov\.be/[^)]+)\)'
-            url_match = re.search(url_pattern, footnote_content)
+            url_match = self.utils.footnote_url_pattern.search(footnote_content)
 
             if url_match:
                 direct_url = url_match.group(1)
@@ -133,8 +131,14 @@ class FootnoteProcessor:
             elif referenced_article.lower().startswith('art '):
                 referenced_article = referenced_article[4:].strip()
 
-            # Extract URLs from footnote content using the referenced article number
-            direct_url, direct_article_url = self.extract_footnote_urls(citation.group(0), law_url, referenced_article)
+            # Extract URLs from footnote content using the referenced article number.
+            # The law URL is the first URL in parentheses of the citation: when it
+            # is an ejustice URL, the content scan would find that same URL, so it
+            # is used directly instead of scanning the citation again
+            if self.utils.footnote_url_pattern.match(footnote_section, citation.start(4) - 1):
+                direct_url, direct_article_url = self.extract_footnote_urls("", law_url, referenced_article)
+            else:
+                direct_url, direct_article_url = self.extract_footnote_urls(citation.group(0), law_url, referenced_article)
 
             footnote = {
                 "footnote_number": footnote_number,
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+hardcoded_jsons - Hardcoded JSON structures for edge case documents
+
+These documents have complex structural problems that are difficult to fix
+programmatically, so we use pre-processed correct JSON instead.
+
+Documents included:
+- 2020030910: Has duplicate CHAPITRE V nodes
+- 1999036088: Has duplicate article numbers
+- 2016A29166: Has duplicate CHAPITRE 2 nodes
+
+The corrected documents are stored as xz (LZMA) compressed MessagePack blobs
+(msgspec) concatenated into a single archive (data/documents.bin), behind a
+header holding the index that maps each document id to its (offset, length)
+slice. The archive is memory-mapped on first use and only the requested slice
+is decompressed and decoded into the typed structures of schema.py.
+
+A document is the unit of storage: compressing each article separately would
+more than double the archive (the articles of a document share most of their
+vocabulary), so articles are looked up in the decoded, cached document.
+
+Use get_hardcoded_json(document_id) to fetch a document. The historical
+get_json_<document_id>() getters are still available; they are resolved
+lazily through the package __getattr__ for every document in the index.
+iter_articles(document_id) yields the article nodes one at a time and
+get_article(document_id, article_number) looks one up by its number, and
+find_footnotes(document_id, law_type, date_reference) returns the footnotes
+citing a given law.
+
+To update these JSONs:
+1. Load the existing JSON from output/24/
+2. Manually fix the structural issues and save it as <document_id>.json
+3. Rebuild the archive from src/markdown_processing with
+   python -m hardcoded_jsons SOURCE_DIR [DOCUMENT_ID ...]
+"""
+
+import lzma
+import mmap
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import msgspec
+from msgspec import UNSET
+
+from .rendering import strip_main_text
+from .schema import (Document, Footnote, Node, compact_footnote, compact_footnote_reference,
+                     generation_offset)
+
+DATA_DIR = Path(__file__).parent / "data"
+ARCHIVE_PATH = DATA_DIR / "documents.bin"
+
+# documents.bin starts with the length of the index (little-endian uint32),
+# followed by the JSON index, then the blobs. Offsets count from the end of the
+# index, and the archive is replaced as a whole, so readers never see an index
+# and blobs from different builds.
+_INDEX_LENGTH = struct.Struct("<I")
+
+# The blobs are highly repetitive legal text, compressed only when the archive
+# is rebuilt and decompressed once per process: favour ratio over speed.
+# LZMA extreme is ~25% smaller than zlib -9 here; a preset dictionary shared by
+# the documents does not pay for its own size with so few documents.
+COMPRESSION_PRESET = 9 | lzma.PRESET_EXTREME
+
+_decoder = msgspec.msgpack.Decoder(Document)
+_GETTER_PREFIX = "get_json_"
+
+_archive: Optional[mmap.mmap] = None
+
+
+def _iter_article_dicts(nodes: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield the article nodes of a JSON document hierarchy."""
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if "article_content" in node:
+            yield node
+        stack.extend(reversed(node.get("children", [])))
+
+
+def encode_document(document: Dict[str, Any]) -> bytes:
+    """Validate a corrected JSON document against the schema and encode it.
+
+    The article HTML wrapper, the provision list items and the footnote-ref
+    spans are stripped from every main_text, they are rendered back from the
+    article data when the document is loaded. Generation
+    timestamps are stored as microsecond offsets, and the paragraph and
+    provision counts are derived from the content instead of being stored,
+    as are the footnote URLs, citation texts, law full references and
+    bracket patterns.
+
+    The encoded document is decoded back and compared with the input, so a
+    field that would not be restored identically fails the build.
+
+    Raises:
+        ValueError: If the document still has duplicate article numbers, or
+            would not be restored identically from the archive
+    """
+    source = msgspec.json.encode(document)
+    document = msgspec.json.decode(source)
+    article_numbers = set()
+    for node in _iter_article_dicts(document["document_hierarchy"]):
+        article_content = node["article_content"]
+        if article_content["article_number"] in article_numbers:
+            raise ValueError(f"Duplicate article number: {article_content['article_number']}")
+        article_numbers.add(article_content["article_number"])
+        content = article_content["content"]
+        # main_text is left out by MD8 when the HTML generation of the article failed
+        if "main_text" in content:
+            content["main_text"] = strip_main_text(article_content["article_number"], content["main_text"],
+                                                   content["numbered_provisions"], node.get("footnotes", []),
+                                                   node.get("footnote_references", []))
+        metadata = content.get("structured_content_metadata")
+        if "structured_content_metadata" in content and not metadata:
+            raise ValueError(f"Empty structured_content_metadata in article {article_content['article_number']}")
+        if metadata:
+            metadata["generation_timestamp"] = generation_offset(metadata["generation_timestamp"])
+            counts = (metadata.pop("paragraph_count"), metadata.pop("provision_count"))
+            paragraphs = content["main_text"]["paragraphs"] if isinstance(content.get("main_text"), dict) else ()
+            if counts != (len(paragraphs), len(content["numbered_provisions"])):
+                raise ValueError(f"Counts of article {article_content['article_number']} do not match its content")
+        for footnote in node.get("footnotes", []):
+            compact_footnote(footnote)
+        for reference in node.get("footnote_references", []):
+            compact_footnote_reference(reference)
+    blob = msgspec.msgpack.encode(msgspec.convert(document, Document))
+    if msgspec.json.encode(to_dict(_decoder.decode(blob))) != source:
+        raise ValueError("Document would not be restored identically from the archive")
+    return blob
+
+
+def write_archive(documents: Dict[str, Dict[str, Any]]) -> None:
+    """Rebuild documents.bin from corrected JSON documents.
+
+    Every document is encoded and compressed before anything is written, and
+    the archive is written to a temporary path then moved into place, so a
+    document that fails validation leaves the current archive untouched.
+    """
+    blobs = {document_id: lzma.compress(encode_document(document), preset=COMPRESSION_PRESET)
+             for document_id, document in documents.items()}
+    index = {}
+    offset = 0
+    for document_id, blob in blobs.items():
+        index[document_id] = (offset, len(blob))
+        offset += len(blob)
+
+    encoded_index = msgspec.json.encode(index)
+    archive_tmp = ARCHIVE_PATH.with_name(ARCHIVE_PATH.name + ".tmp")
+    archive_tmp.write_bytes(b"".join([_INDEX_LENGTH.pack(len(encoded_index)), encoded_index, *blobs.values()]))
+    os.replace(archive_tmp, ARCHIVE_PATH)
+
+
+@lru_cache(maxsize=None)
+def _load_index() -> Dict[str, Tuple[int, int]]:
+    """Load the document id -> (offset, length) index from the archive header.
+
+    The returned offsets are absolute positions in the archive.
+    """
+    archive = _open_archive()
+    (index_length,) = _INDEX_LENGTH.unpack_from(archive)
+    start = _INDEX_LENGTH.size + index_length
+    index = msgspec.json.decode(archive[_INDEX_LENGTH.size:start], type=Dict[str, Tuple[int, int]])
+    return {document_id: (start + offset, length) for document_id, (offset, length) in index.items()}
+
+
+def _open_archive() -> mmap.mmap:
+    """Memory-map the document archive (once per process)."""
+    global _archive
+    if _archive is None:
+        with open(ARCHIVE_PATH, "rb") as f:
+            _archive = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _archive
+
+
+@lru_cache(maxsize=None)
+def load_document(document_id: str) -> Document:
+    """Decompress and decode the archived blob of a hardcoded document.
+
+    Each document is decoded once per process. The returned Document is frozen,
+    so the cached instance is shared read-only by every caller.
+    """
+    offset, length = _load_index()[document_id]
+    archive = _open_archive()
+    return _decoder.decode(lzma.decompress(memoryview(archive)[offset:offset + length]))
+
+
+def _footnote_to_dict(footnote: Footnote, law_reference: Dict[str, Any]) -> Dict[str, Any]:
+    law_reference["full_reference"] = footnote.law_reference.full_reference
+    return {
+        "footnote_number": footnote.footnote_number,
+        "footnote_content": footnote.footnote_content,
+        "law_reference": law_reference,
+        "effective_date": footnote.effective_date,
+        "modification_type": footnote.modification_type,
+        "direct_url": footnote.direct_url,
+        "direct_article_url": footnote.direct_article_url,
+    }
+
+
+def _restore_article_fields(node: Node, node_dict: Dict[str, Any]) -> None:
+    """Replace the compact stored fields of an article node dict by their JSON values."""
+    article_content = node.article_content
+    content = node_dict["article_content"]["content"]
+    if article_content.content.main_text_body is not UNSET:
+        content["main_text"] = node.main_text
+    for provision in content["numbered_provisions"]:
+        provision.setdefault("sub_items", ())
+    for reference, reference_dict in zip(node.footnote_references, node_dict["footnote_references"]):
+        reference_dict["bracket_pattern"] = reference.bracket_pattern
+    node_dict["footnotes"] = [_footnote_to_dict(footnote, footnote_dict["law_reference"])
+                              for footnote, footnote_dict in zip(node.footnotes, node_dict["footnotes"])]
+    metadata = article_content.content.structured_content_metadata
+    if metadata:
+        content["structured_content_metadata"] = {
+            "paragraph_count": article_content.content.paragraph_count,
+            "provision_count": article_content.content.provision_count,
+            "has_tables": metadata.has_tables,
+            "generation_timestamp": metadata.generation_timestamp,
+        }
+
+
+def _to_lists(value: Any) -> Any:
+    """Convert the tuples of a to_builtins() structure to lists (dicts are updated in place)."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list, tuple)):
+                value[key] = _to_lists(item)
+        return value
+    return [_to_lists(item) if isinstance(item, (dict, list, tuple)) else item for item in value]
+
+
+def to_dict(document: Document) -> Dict[str, Any]:
+    """Convert a typed Document back to the JSON structure produced by MD8.
+
+    The arrays the Structs keep as tuples are returned as lists, so the result
+    can be modified like the output of json.load().
+    """
+    data = msgspec.to_builtins(document)
+    stack = list(zip(document.document_hierarchy, data["document_hierarchy"]))
+    while stack:
+        node, node_dict = stack.pop()
+        if node.article_content:
+            _restore_article_fields(node, node_dict)
+        if node.children:
+            stack.extend(zip(node.children, node_dict["children"]))
+    return _to_lists(data)
+
+
+@lru_cache(maxsize=None)
+def hardcoded_document_ids() -> FrozenSet[str]:
+    """Return the ids of the documents served from the archive."""
+    return frozenset(_load_index())
+
+
+def get_hardcoded_json(document_id: str) -> Dict[str, Any]:
+    """Return the corrected JSON structure of a hardcoded document.
+
+    Raises:
+        ValueError: If no hardcoded JSON exists for the document
+    """
+    if document_id not in _load_index():
+        raise ValueError(f"No hardcoded JSON available for document: {document_id}")
+    # Callers (MD8) get fresh dicts and lists built from the cached Document
+    # rather than a shared read-only structure
+    return to_dict(load_document(document_id))
+
+
+def _iter_article_nodes(document: Document) -> Iterator[Node]:
+    """Yield the article nodes of a typed Document in document order."""
+    stack = list(reversed(document.document_hierarchy))
+    while stack:
+        node = stack.pop()
+        if node.article_content:
+            yield node
+        if node.children:
+            stack.extend(reversed(node.children))
+
+
+def _article_to_dict(node: Node) -> Dict[str, Any]:
+    node_dict = msgspec.to_builtins(node)
+    _restore_article_fields(node, node_dict)
+    return _to_lists(node_dict)
+
+
+def iter_articles(document_id: str) -> Iterator[Dict[str, Any]]:
+    """Return an iterator over the article nodes of a hardcoded document.
+
+    Articles come in document order, each converted to its JSON structure only
+    when reached, so callers that process articles independently never hold
+    the dict form of the whole hierarchy.
+
+    Raises:
+        ValueError: If no hardcoded JSON exists for the document (when called,
+            not on the first next())
+    """
+    if document_id not in _load_index():
+        raise ValueError(f"No hardcoded JSON available for document: {document_id}")
+    return (_article_to_dict(node) for node in _iter_article_nodes(load_document(document_id)))
+
+
+@lru_cache(maxsize=None)
+def article_index(document_id: str) -> Dict[str, Node]:
+    """Map each article_number of a hardcoded document to its (read-only) article node.
+
+    Built in one pass over the hierarchy the first time it is requested.
+    """
+    return {node.article_content.article_number: node
+            for node in _iter_article_nodes(load_document(document_id))}
+
+
+def get_article(document_id: str, article_number: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON structure of one article node, or None if the document has no such article.
+
+    Raises:
+        ValueError: If no hardcoded JSON exists for the document
+    """
+    if document_id not in _load_index():
+        raise ValueError(f"No hardcoded JSON available for document: {document_id}")
+    node = article_index(document_id).get(article_number)
+    return _article_to_dict(node) if node else None
+
+
+@lru_cache(maxsize=None)
+def footnote_index(document_id: str) -> Dict[Tuple[str, str], Tuple[Footnote, ...]]:
+    """Map each (law_type, date_reference) cited by a hardcoded document to its (read-only) footnotes.
+
+    Footnotes citing the same law come in document order. Built in one pass
+    over the articles the first time it is requested.
+    """
+    index: Dict[Tuple[str, str], List[Footnote]] = {}
+    for node in _iter_article_nodes(load_document(document_id)):
+        for footnote in node.footnotes or ():
+            law_reference = footnote.law_reference
+            index.setdefault((law_reference.law_type, law_reference.date_reference), []).append(footnote)
+    return {key: tuple(footnotes) for key, footnotes in index.items()}
+
+
+def find_footnotes(document_id: str, law_type: str, date_reference: str) -> List[Dict[str, Any]]:
+    """Return the JSON structure of the footnotes of a document citing a law (e.g. "AGF", "2011-11-10/07").
+
+    Raises:
+        ValueError: If no hardcoded JSON exists for the document
+    """
+    if document_id not in _load_index():
+        raise ValueError(f"No hardcoded JSON available for document: {document_id}")
+    return [_footnote_to_dict(footnote, msgspec.to_builtins(footnote.law_reference))
+            for footnote in footnote_index(document_id).get((law_type, date_reference), ())]
+
+
+def __getattr__(name: str) -> Callable[[], Dict[str, Any]]:
+    """Resolve the legacy get_json_<document_id> getters lazily (PEP 562).
+
+    Importing the package does not touch the archive; a getter is created the
+    first time it is looked up and then cached in the module namespace.
+    """
+    document_id = name[len(_GETTER_PREFIX):]
+    if not name.startswith(_GETTER_PREFIX) or document_id not in _load_index():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def getter() -> Dict[str, Any]:
+        return get_hardcoded_json(document_id)
+
+    getter.__name__ = getter.__qualname__ = name
+    getter.__doc__ = f"Return corrected JSON for document {document_id}."
+    globals()[name] = getter
+    return getter
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | {_GETTER_PREFIX + document_id for document_id in _load_index()})
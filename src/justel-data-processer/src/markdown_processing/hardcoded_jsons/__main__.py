@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+__main__.py - Rebuild the hardcoded documents archive from corrected JSON files
+
+Usage (from src/markdown_processing):
+    python -m hardcoded_jsons [SOURCE_DIR] [DOCUMENT_ID ...]
+
+Reads SOURCE_DIR/<document_id>.json (default: output/24) for every document
+id given, or for every document already in the archive, validates each one
+against the schema and rewrites data/documents.bin.
+Archived documents that are not given keep their current version.
+
+Author: Augment Agent
+Date: 2026-10-17
+"""
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+from . import hardcoded_document_ids, load_document, to_dict, write_archive
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE_DIR = "output/24"
+
+
+def main():
+    source_dir = Path(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOURCE_DIR)
+    document_ids = sys.argv[2:] or sorted(hardcoded_document_ids())
+
+    documents = {document_id: to_dict(load_document(document_id))
+                 for document_id in hardcoded_document_ids() - set(document_ids)}
+    for document_id in document_ids:
+        source_path = source_dir / f"{document_id}.json"
+        if not source_path.exists():
+            logger.error(f"Corrected JSON not found: {source_path}")
+            sys.exit(1)
+        with open(source_path, 'r', encoding='utf-8') as f:
+            documents[document_id] = json.load(f)
+
+    write_archive(dict(sorted(documents.items())))
+    logger.info(f"Archived {len(document_ids)} hardcoded documents from {source_dir} "
+                f"({len(documents)} documents in the archive)")
+
+
+if __name__ == "__main__":
+    main()
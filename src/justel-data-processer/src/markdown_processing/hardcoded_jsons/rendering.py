@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+rendering.py - HTML rendering for the hardcoded edge case documents
+
+Every article main_text produced by LegalHtmlGenerator follows the same
+templates: an <article>/<header> wrapper with only the article number varying,
+around either a single article-text div or a sequence of numbered paragraph
+(§) sections. The stored documents keep only the variable parts (the inner
+HTML, or a (marker, html) pair per paragraph); the templates live once here
+and are rendered on access.
+
+Inside the stored HTML, markup that can be rebuilt from the article data is
+replaced by references to it, so the data is not stored twice:
+- a provision list item that matches its provision exactly is replaced by the
+  index of the provision in numbered_provisions
+- a footnote-ref span is replaced by the indexes of its footnote reference and
+  footnote (which carry its number, referenced text and article URL) and the
+  text it wraps
+Markup that does not render back identically stays literal.
+
+parse_main_text() keeps a parsed tree per article so consumers walking the
+HTML do not re-parse the same static strings; each caller gets its own copy.
+
+Author: Augment Agent
+Date: 2026-10-17
+"""
+
+import copy
+import html
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+_ARTICLE_OPEN = (
+    '<article class="legal-article" id="art-{number}">'
+    '<header class="article-header"><h2 class="article-number">Article {number}</h2></header>'
+    '<div class="article-content">'
+)
+_ARTICLE_CLOSE = '</div></article>'
+_ARTICLE_TEXT = '<div class="article-text">{html}</div>'
+_PROVISION = (
+    '<li class="provision" data-number="{number}"><span class="provision-text">{text}</span></li>'
+)
+_FOOTNOTE_REF = (
+    '<span class="footnote-ref" data-footnote-id="{number}" data-referenced-text="{referenced_text}" '
+    'data-direct-article-url="{url}" data-article-dossier-number="">{text}</span>'
+)
+_PARAGRAPH = (
+    '<section class="paragraph" id="para-{marker}"><h3 class="paragraph-marker">§ {marker}.</h3>'
+    '<div class="paragraph-content">{html}</div></section>'
+)
+
+# Templates pre-split around their placeholders, so rendering is a single
+# "".join over constant pieces instead of a str.format() parse per call
+_OPEN_HEAD, _OPEN_MIDDLE, _OPEN_TAIL = _ARTICLE_OPEN.split("{number}")
+_TEXT_HEAD, _TEXT_TAIL = _ARTICLE_TEXT.split("{html}")
+_PARA_HEAD, _PARA_MIDDLE, _PARA_CONTENT, _PARA_TAIL = re.split(r"\{\w+\}", _PARAGRAPH)
+_PROVISION_HEAD, _PROVISION_MIDDLE, _PROVISION_TAIL = re.split(r"\{\w+\}", _PROVISION)
+_REF_HEAD, _REF_TEXT, _REF_URL, _REF_CONTENT, _REF_TAIL = re.split(r"\{\w+\}", _FOOTNOTE_REF)
+
+_PARAGRAPH_PATTERN = re.compile(
+    r'<section class="paragraph" id="para-([^"]*)"><h3 class="paragraph-marker">§ \1\.</h3>'
+    r'<div class="paragraph-content">(.*?)</div></section>',
+    re.DOTALL
+)
+_PROVISION_PATTERN = re.compile(
+    r'<li class="provision" data-number="[^"]*"><span class="provision-text">.*?</span></li>',
+    re.DOTALL
+)
+_FOOTNOTE_REF_PATTERN = re.compile(
+    r'<span class="footnote-ref" data-footnote-id="([^"]*)" data-referenced-text="([^"]*)" '
+    r'data-direct-article-url="([^"]*)" data-article-dossier-number="">([^<]*)</span>'
+)
+
+# Stored HTML: a plain string, or segments mixing literal HTML, provision
+# indexes and footnote references ([reference index, footnote index, text])
+Html = Union[str, Sequence[Any]]
+Segments = List[Union[str, int, List[Any]]]
+
+
+def escape(text: str) -> str:
+    """HTML escape as done by LegalHtmlGenerator (apostrophes are kept)."""
+    return html.escape(text).replace('&#x27;', "'")
+
+
+def _provision_html(number: str, text: str) -> str:
+    return "".join([_PROVISION_HEAD, escape(number), _PROVISION_MIDDLE, escape(text), _PROVISION_TAIL])
+
+
+def _footnote_ref_html(number: str, referenced_text: str, url: str, text: str) -> str:
+    return "".join([_REF_HEAD, escape(number), _REF_TEXT, escape(referenced_text), _REF_URL, escape(url),
+                    _REF_CONTENT, escape(text), _REF_TAIL])
+
+
+def _html_parts(html_body: Html, render_segment: Callable[[Any], str]) -> List[str]:
+    if isinstance(html_body, str):
+        return [html_body]
+    return [segment if isinstance(segment, str) else render_segment(segment) for segment in html_body]
+
+
+def _body_parts(body: Any, render_segment: Callable[[Any], str]) -> List[str]:
+    if isinstance(body, (str, tuple)):
+        return [_TEXT_HEAD, *_html_parts(body, render_segment), _TEXT_TAIL]
+    parts = []
+    for paragraph in body.paragraphs:
+        marker = paragraph.marker
+        parts += (_PARA_HEAD, marker, _PARA_MIDDLE, marker, _PARA_CONTENT,
+                  *_html_parts(paragraph.html, render_segment), _PARA_TAIL)
+    return parts
+
+
+@lru_cache(maxsize=256)
+def render_main_text(article_number: str, body: Any, provisions: Tuple[Any, ...] = (),
+                     footnotes: Tuple[Any, ...] = (), footnote_references: Tuple[Any, ...] = ()) -> str:
+    """Render the full article HTML from its stored body.
+
+    Args:
+        article_number: Article number shown in the header and used as anchor
+        body: Stored HTML of the article-text div, or the ParagraphSections of
+            an article split into numbered paragraphs
+        provisions: The article numbered_provisions the stored HTML refers to
+        footnotes: The article footnotes the stored HTML refers to
+        footnote_references: The article footnote_references the stored HTML refers to
+
+    Returns:
+        The main_text HTML as generated by LegalHtmlGenerator
+    """
+    provisions_html = [_provision_html(provision.number, provision.text) for provision in provisions]
+
+    def render_segment(segment: Any) -> str:
+        if isinstance(segment, int):
+            return provisions_html[segment]
+        reference = footnote_references[segment.reference]
+        return _footnote_ref_html(reference.reference_number, reference.referenced_text,
+                                  footnotes[segment.footnote].direct_article_url, segment.text)
+
+    return "".join([_OPEN_HEAD, article_number, _OPEN_MIDDLE, article_number, _OPEN_TAIL,
+                    *_body_parts(body, render_segment), _ARTICLE_CLOSE])
+
+
+@lru_cache(maxsize=256)
+def _parsed_main_text(main_text: str) -> "BeautifulSoup":
+    return BeautifulSoup(main_text, 'html.parser')
+
+
+def parse_main_text(main_text: str) -> "BeautifulSoup":
+    """Return the parsed tree of an article main_text.
+
+    The HTML is parsed once and the tree cached; every call returns a copy
+    (copy.copy) of it, so callers may modify their tree freely.
+
+    Raises:
+        ImportError: If BeautifulSoup is not installed
+    """
+    if not BS4_AVAILABLE:
+        raise ImportError("beautifulsoup4 is required to parse article HTML")
+    return copy.copy(_parsed_main_text(main_text))
+
+
+def _split_segments(segments: Segments, pattern: re.Pattern,
+                    to_segment: Callable[[re.Match], Any]) -> Segments:
+    """Replace the matches of pattern inside the literal segments by to_segment(match).
+
+    Matches for which to_segment returns None stay literal.
+    """
+    result: Segments = []
+    for segment in segments:
+        if not isinstance(segment, str):
+            result.append(segment)
+            continue
+        position = 0
+        for match in pattern.finditer(segment):
+            replacement = to_segment(match)
+            if replacement is None:
+                continue
+            if match.start() > position:
+                result.append(segment[position:match.start()])
+            result.append(replacement)
+            position = match.end()
+        if position < len(segment):
+            result.append(segment[position:])
+    return result
+
+
+def _strip_html(html_body: str, provisions: Sequence[Dict[str, Any]], footnotes: Sequence[Dict[str, Any]],
+                footnote_references: Sequence[Dict[str, Any]]) -> Union[str, Segments]:
+    """Replace the markup of html_body that renders back from the article data by references to it."""
+    provision_indexes: Dict[str, int] = {}
+    for index, provision in enumerate(provisions):
+        provision_indexes.setdefault(_provision_html(provision["number"], provision["text"]), index)
+    reference_indexes: Dict[Tuple[str, str], int] = {}
+    for index, reference in enumerate(footnote_references):
+        key = (escape(reference["reference_number"]), escape(reference["referenced_text"]))
+        reference_indexes.setdefault(key, index)
+    footnote_indexes: Dict[Tuple[str, str], int] = {}
+    for index, footnote in enumerate(footnotes):
+        footnote_indexes.setdefault((escape(footnote["footnote_number"]), escape(footnote["direct_article_url"])), index)
+
+    def footnote_ref_segment(match: re.Match) -> Any:
+        number, referenced_text, url, text = match.groups()
+        reference = reference_indexes.get((number, referenced_text))
+        footnote = footnote_indexes.get((number, url))
+        if reference is None or footnote is None or escape(html.unescape(text)) != text:
+            return None
+        return [reference, footnote, html.unescape(text)]
+
+    segments = _split_segments([html_body], _PROVISION_PATTERN, lambda match: provision_indexes.get(match.group(0)))
+    segments = _split_segments(segments, _FOOTNOTE_REF_PATTERN, footnote_ref_segment)
+    if segments == [html_body]:
+        return html_body
+    return segments
+
+
+def strip_main_text(article_number: str, main_text: str, provisions: Sequence[Dict[str, Any]] = (),
+                    footnotes: Sequence[Dict[str, Any]] = (),
+                    footnote_references: Sequence[Dict[str, Any]] = ()) -> Union[str, Segments, Dict[str, Any]]:
+    """Reduce a generated main_text to the body stored for it (inverse of render_main_text).
+
+    Args:
+        article_number: Article number of the article
+        main_text: Generated article HTML
+        provisions: The article numbered_provisions
+        footnotes: The article footnotes
+        footnote_references: The article footnote_references
+
+    Returns:
+        The stored HTML of the article-text div, or {"paragraphs": [...]} with
+        a [marker, html] pair per numbered paragraph section
+
+    Raises:
+        ValueError: If main_text does not follow the article templates
+    """
+    prefix = _ARTICLE_OPEN.format(number=article_number)
+    if not (main_text.startswith(prefix) and main_text.endswith(_ARTICLE_CLOSE)):
+        raise ValueError(f"main_text of article {article_number} does not follow the article template")
+    inner = main_text[len(prefix):len(main_text) - len(_ARTICLE_CLOSE)]
+
+    if inner.startswith(_TEXT_HEAD) and inner.endswith(_TEXT_TAIL):
+        return _strip_html(inner[len(_TEXT_HEAD):len(inner) - len(_TEXT_TAIL)],
+                           provisions, footnotes, footnote_references)
+
+    paragraphs = [[match.group(1), match.group(2)] for match in _PARAGRAPH_PATTERN.finditer(inner)]
+    rendered = "".join(_PARAGRAPH.format(marker=marker, html=html_body) for marker, html_body in paragraphs)
+    if rendered != inner:
+        raise ValueError(f"main_text of article {article_number} does not follow the paragraph template")
+    return {"paragraphs": [[marker, _strip_html(html_body, provisions, footnotes, footnote_references)]
+                           for marker, html_body in paragraphs]}
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+schema.py - Typed structures for the hardcoded edge case documents
+
+The hardcoded documents follow the same JSON layout as the regular MD8 output
+(see json_schema.py). These msgspec Structs describe that layout so the stored
+blobs can be decoded straight into compact, frozen objects instead of nested
+dicts; Structs are slotted, so a node costs a fraction of a dict with the same
+keys. Field order matches the key order of the MD8 output, so converting a
+Document back with msgspec.to_builtins() yields the original JSON structure.
+
+Optional keys that only some articles carry (abrogation_status, legal_citation,
+...) default to UNSET and are left out of the converted output when absent.
+Keys that are not declared here are rejected (forbid_unknown_fields), so a
+document carrying new MD8 fields fails to archive instead of losing them.
+
+Arrays are decoded as tuples: they are smaller than lists, and every empty
+array (most sub_items, footnotes, ...) is the shared empty tuple.
+
+Many string fields repeat across the documents: low-cardinality ones (node
+types, provision numbers, law types, effective dates, ...) hundreds of times,
+and long French phrases (referenced texts, provision texts, footnote contents,
+citations) dozens of times. They are deduplicated in __post_init__ through a
+process-wide string pool so every occurrence shares a single str object.
+
+Author: Augment Agent
+Date: 2026-10-17
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Tuple, Union
+
+import msgspec
+from msgspec import UNSET, UnsetType
+from msgspec.structs import force_setattr
+
+from .rendering import parse_main_text, render_main_text
+
+# generation_timestamp values are naive ISO timestamps (datetime.now()) taken
+# within minutes of each other; they are stored as microsecond offsets from
+# this base and formatted back on access
+GENERATION_TIMESTAMP_BASE = datetime(2025, 8, 19, 14, 5, 18)
+
+CN_SEARCH_URL = "https://www.ejustice.just.fgov.be/cgi_loi/article.pl?language=fr&lg_txt=f&cn_search="
+
+
+# Pool of the strings shared by the decoded documents; unlike sys.intern()
+# it keeps long phrases out of the interpreter-wide interned table
+_string_pool: Dict[str, str] = {}
+
+
+def _intern_fields(struct: msgspec.Struct, fields: Tuple[str, ...]) -> None:
+    """Replace the given string (or tuple of strings) fields of a frozen struct by pooled copies."""
+    for name in fields:
+        value = getattr(struct, name)
+        if isinstance(value, str):
+            force_setattr(struct, name, _string_pool.setdefault(value, value))
+        elif isinstance(value, tuple) and value:
+            force_setattr(struct, name, tuple(_string_pool.setdefault(item, item) for item in value))
+
+
+class VersionInfo(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Archived versions and execution orders of a document."""
+    archived_versions_count: int
+    archived_versions_url: str
+    execution_orders_count: int
+    execution_orders_url: str
+
+
+class DocumentMetadata(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Document level metadata (document_metadata)."""
+    document_number: str
+    title: str
+    publication_date: str
+    source: str
+    page_number: Union[int, None]
+    dossier_number: str
+    effective_date: str
+    end_validity_date: str
+    language: str
+    document_type: str
+    status: str
+    version_info: VersionInfo
+    official_justel_url: str
+    official_publication_pdf_url: str
+    consolidated_pdf_url: str
+
+
+class NodeMetadata(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Metadata of a hierarchy node (title nodes and article nodes)."""
+    title_type: Union[str, UnsetType] = UNSET
+    title_content: Union[str, UnsetType] = UNSET
+    article_range: Union[str, UnsetType] = UNSET
+    rank: Union[int, UnsetType] = UNSET
+
+    def __post_init__(self):
+        _intern_fields(self, ("title_type", "title_content"))
+
+
+class Provision(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True, omit_defaults=True):
+    """A numbered provision (1°, 2°, a), ...) of an article.
+
+    sub_items is empty for virtually every provision; it is only stored when
+    it is not (the JSON output still carries "sub_items": []).
+    """
+    number: str
+    text: str
+    sub_items: Tuple[Any, ...] = ()
+
+    def __post_init__(self):
+        _intern_fields(self, ("number", "text"))
+
+
+def generation_offset(timestamp: str) -> Union[int, str]:
+    """Convert a generation_timestamp to its offset from GENERATION_TIMESTAMP_BASE.
+
+    Timestamps that would not be formatted back identically are returned unchanged.
+    """
+    try:
+        offset = (datetime.fromisoformat(timestamp) - GENERATION_TIMESTAMP_BASE) // timedelta(microseconds=1)
+    except (TypeError, ValueError):
+        return timestamp
+    if format_generation_timestamp(offset) != timestamp:
+        return timestamp
+    return offset
+
+
+def format_generation_timestamp(offset_us: Union[int, str]) -> str:
+    """Format a stored microsecond offset back to its generation_timestamp."""
+    if isinstance(offset_us, str):
+        return offset_us
+    # isoformat() leaves out the fraction when it is zero, as datetime.now().isoformat() does
+    return (GENERATION_TIMESTAMP_BASE + timedelta(microseconds=offset_us)).isoformat()
+
+
+class StructuredContentMetadata(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Statistics recorded when the article HTML was generated.
+
+    paragraph_count and provision_count are not stored, they are derived from
+    the article content (Content.paragraph_count, Content.provision_count).
+    """
+    has_tables: bool
+    # Offset in microseconds, or the timestamp itself when it is not in the
+    # datetime.now().isoformat() form
+    generation_offset_us: Union[int, str] = msgspec.field(name="generation_timestamp")
+
+    @property
+    def generation_timestamp(self) -> str:
+        """ISO timestamp of the HTML generation."""
+        return format_generation_timestamp(self.generation_offset_us)
+
+
+class LegalCitation(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Legal citation attached to an abrogated article."""
+    full_text: str
+    urls: Tuple[str, ...]
+
+    def __post_init__(self):
+        _intern_fields(self, ("full_text", "urls"))
+
+
+class EnhancedCitation(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Citation parsed by the enhanced citation parser."""
+    citation_type: str
+    law_type: str
+    dossier_number: str
+    article_number: str
+    sequence_number: str
+    effective_date: str
+    url: str
+    full_text: str
+    prefix: str
+    raw_dossier: str
+    raw_article: str
+    start_pos: int
+    end_pos: int
+    matched_text: str
+
+    def __post_init__(self):
+        _intern_fields(self, ("citation_type", "law_type", "dossier_number", "url", "full_text", "prefix",
+                              "raw_dossier", "matched_text"))
+
+
+class FootnoteRef(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True, array_like=True):
+    """footnote-ref span of an article HTML body, rendered from the article footnotes."""
+    reference: int
+    footnote: int
+    text: str
+
+
+# Stored article HTML: a plain string, or literal HTML segments mixed with
+# indexes of the numbered provisions and footnote-ref spans rendered in their
+# place (see rendering.py)
+Html = Union[str, Tuple[Union[str, int, FootnoteRef], ...]]
+
+
+class Paragraph(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True, array_like=True):
+    """Numbered paragraph (§ 1er, § 2, ...) of an article HTML body."""
+    marker: str
+    html: Html
+
+
+class ParagraphSections(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """HTML body of an article split into numbered paragraph sections."""
+    paragraphs: Tuple[Paragraph, ...]
+
+
+class Content(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Text and HTML content of an article (article_content.content)."""
+    main_text_raw: str
+    numbered_provisions: Tuple[Provision, ...]
+    abrogation_status: Union[str, UnsetType] = UNSET
+    # Only the variable parts of the article HTML are stored (the article-text
+    # HTML or the numbered paragraphs), the templates live in rendering.py
+    main_text_body: Union[Html, ParagraphSections, UnsetType] = msgspec.field(default=UNSET, name="main_text")
+    structured_content_metadata: Union[StructuredContentMetadata, UnsetType] = UNSET
+    has_preserved_tables: Union[bool, UnsetType] = UNSET
+    legal_citation: Union[LegalCitation, UnsetType] = UNSET
+    enhanced_citations: Union[Tuple[EnhancedCitation, ...], UnsetType] = UNSET
+
+    @property
+    def paragraph_count(self) -> int:
+        """Number of numbered paragraph (§) sections of the article HTML."""
+        if isinstance(self.main_text_body, ParagraphSections):
+            return len(self.main_text_body.paragraphs)
+        return 0
+
+    @property
+    def provision_count(self) -> int:
+        """Number of numbered provisions of the article."""
+        return len(self.numbered_provisions)
+
+
+class ArticleContent(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Article payload of an article node."""
+    article_number: str
+    anchor_id: str
+    content: Content
+
+    def __post_init__(self):
+        _intern_fields(self, ("article_number", "anchor_id"))
+
+
+class LawReference(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Law cited by a footnote.
+
+    full_reference is only stored when it differs from "<law_type> [<date_reference>]".
+    """
+    law_type: str
+    date_reference: str
+    article_number: str
+    sequence_number: str
+    full_reference_override: Union[str, UnsetType] = msgspec.field(default=UNSET, name="full_reference")
+
+    def __post_init__(self):
+        _intern_fields(self, ("law_type", "date_reference", "sequence_number", "full_reference_override"))
+
+    @property
+    def full_reference(self) -> str:
+        if self.full_reference_override is not UNSET:
+            return self.full_reference_override
+        return _full_reference(self.law_type, self.date_reference)
+
+
+def _full_reference(law_type: str, date_reference: str) -> str:
+    """full_reference as built by FootnoteProcessor.extract_footnotes_from_section."""
+    return f"{law_type} [{date_reference}]"
+
+
+def format_footnote_content(footnote_number: str, full_reference: str, direct_url: str, article_number: str,
+                            sequence_number: str, effective_date: str) -> str:
+    """Footnote citation text as matched by ExtractionUtils.legal_citation_pattern."""
+    article_reference = f"{article_number}, {sequence_number}" if sequence_number else article_number
+    return f"({footnote_number})<{full_reference}({direct_url}), {article_reference}; En vigueur : {effective_date}>"
+
+
+def compact_footnote(footnote: Dict[str, Any]) -> None:
+    """Replace the derivable fields of a footnote dict by their stored form (see Footnote).
+
+    Raises:
+        ValueError: If the URLs would not be restored identically
+    """
+    law_reference = footnote["law_reference"]
+    if footnote["footnote_content"] == format_footnote_content(
+            footnote["footnote_number"], law_reference["full_reference"], footnote["direct_url"],
+            law_reference["article_number"], law_reference["sequence_number"], footnote["effective_date"]):
+        del footnote["footnote_content"]
+    direct_url = footnote["direct_url"]
+    if direct_url.startswith(CN_SEARCH_URL) and "://" not in direct_url[len(CN_SEARCH_URL):]:
+        footnote["direct_url"] = direct_url[len(CN_SEARCH_URL):]
+    if footnote["direct_article_url"] == _article_url(direct_url, law_reference["article_number"]):
+        del footnote["direct_article_url"]
+    if _full_url(footnote["direct_url"]) != direct_url:
+        raise ValueError(f"Unsupported footnote direct_url: {direct_url}")
+    if law_reference["full_reference"] == _full_reference(law_reference["law_type"], law_reference["date_reference"]):
+        del law_reference["full_reference"]
+
+
+def _full_url(direct_url_ref: str) -> str:
+    if not direct_url_ref or "://" in direct_url_ref:
+        return direct_url_ref
+    return CN_SEARCH_URL + direct_url_ref
+
+
+def _article_url(direct_url: str, article_number: str) -> str:
+    """direct_article_url as built by FootnoteProcessor.extract_footnote_urls."""
+    if article_number.lower().startswith(("art.", "art ")):
+        article_number = article_number[4:].strip()
+    if not (direct_url and article_number):
+        return ""
+    return f"{direct_url.rstrip('/')}#Art.{article_number}"
+
+
+class Footnote(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True, kw_only=True):
+    """Footnote of an article.
+
+    footnote_content, the citation the footnote was parsed from, is only stored
+    when it cannot be rebuilt from the parsed fields ("Inséré par ..." prefixes,
+    article references with several commas).
+
+    Footnote URLs point to the ejustice article page of the modifying law:
+    direct_url is stored as its cn_search value when it has the usual
+    CN_SEARCH_URL form, and direct_article_url (the direct_url with an
+    #Art.<article> anchor) only when it differs from the one derived from the
+    law reference.
+    """
+    footnote_number: str
+    footnote_content_override: Union[str, UnsetType] = msgspec.field(default=UNSET, name="footnote_content")
+    law_reference: LawReference
+    effective_date: str
+    modification_type: str
+    direct_url_ref: str = msgspec.field(name="direct_url")
+    direct_article_url_override: Union[str, UnsetType] = msgspec.field(default=UNSET, name="direct_article_url")
+
+    def __post_init__(self):
+        _intern_fields(self, ("footnote_number", "footnote_content_override", "effective_date", "modification_type",
+                              "direct_url_ref", "direct_article_url_override"))
+
+    @property
+    def footnote_content(self) -> str:
+        if self.footnote_content_override is not UNSET:
+            return self.footnote_content_override
+        law_reference = self.law_reference
+        return format_footnote_content(self.footnote_number, law_reference.full_reference, self.direct_url,
+                                       law_reference.article_number, law_reference.sequence_number,
+                                       self.effective_date)
+
+    @property
+    def direct_url(self) -> str:
+        return _full_url(self.direct_url_ref)
+
+    @property
+    def direct_article_url(self) -> str:
+        if self.direct_article_url_override is not UNSET:
+            return self.direct_article_url_override
+        return _article_url(self.direct_url, self.law_reference.article_number)
+
+
+def _bracket_pattern(reference_number: str, referenced_text: str) -> str:
+    """bracket_pattern of a [N text]N footnote reference (ExtractionUtils format B)."""
+    return f"[{reference_number} {referenced_text}]{reference_number}"
+
+
+def compact_footnote_reference(reference: Dict[str, Any]) -> None:
+    """Drop the bracket_pattern of a footnote reference dict when it can be rebuilt (see FootnoteReference)."""
+    if reference["bracket_pattern"] == _bracket_pattern(reference["reference_number"], reference["referenced_text"]):
+        del reference["bracket_pattern"]
+
+
+class FootnoteReference(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Bracketed footnote reference ([N text]N) inside the article text.
+
+    bracket_pattern is only stored when it is not "[N text]N".
+    """
+    reference_number: str
+    text_position: int
+    referenced_text: str
+    embedded_law_references: Tuple[Any, ...]
+    bracket_pattern_override: Union[str, UnsetType] = msgspec.field(default=UNSET, name="bracket_pattern")
+
+    def __post_init__(self):
+        _intern_fields(self, ("reference_number", "referenced_text", "bracket_pattern_override"))
+
+    @property
+    def bracket_pattern(self) -> str:
+        if self.bracket_pattern_override is not UNSET:
+            return self.bracket_pattern_override
+        return _bracket_pattern(self.reference_number, self.referenced_text)
+
+
+class Node(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Node of the document hierarchy.
+
+    Title nodes (section, chapitre, ...) carry children, article nodes carry
+    article_content together with their footnotes.
+    """
+    type: str
+    label: str
+    metadata: NodeMetadata
+    children: Union[Tuple["Node", ...], UnsetType] = UNSET
+    article_content: Union[ArticleContent, UnsetType] = UNSET
+    footnotes: Union[Tuple[Footnote, ...], UnsetType] = UNSET
+    footnote_references: Union[Tuple[FootnoteReference, ...], UnsetType] = UNSET
+
+    def __post_init__(self):
+        _intern_fields(self, ("type",))
+
+    @property
+    def main_text(self) -> Union[str, UnsetType]:
+        """Full HTML of an article node, as generated by LegalHtmlGenerator.
+
+        UNSET when the article has no main_text (its HTML generation failed).
+        """
+        article_content = self.article_content
+        if article_content.content.main_text_body is UNSET:
+            return UNSET
+        return render_main_text(article_content.article_number, article_content.content.main_text_body,
+                                article_content.content.numbered_provisions, self.footnotes,
+                                self.footnote_references)
+
+    @property
+    def html_tree(self):
+        """Parsed main_text (BeautifulSoup) of an article node, a copy of the cached tree.
+
+        UNSET when the article has no main_text.
+        """
+        main_text = self.main_text
+        return UNSET if main_text is UNSET else parse_main_text(main_text)
+
+
+class ModificationReference(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Entry of references.modified_by."""
+    modification_type: str
+    modification_date: str
+    publication_date: str
+    modified_articles: Tuple[str, ...]
+    source_url: str
+    full_title: str
+
+    def __post_init__(self):
+        _intern_fields(self, ("modification_type", "modified_articles"))
+
+
+class References(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Legal document references and modification history."""
+    modifies: Tuple[Any, ...]
+    modified_by: Tuple[ModificationReference, ...]
+
+
+class ExternalLinks(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Official and parliamentary links of a document."""
+    official_links: Tuple[str, ...]
+    parliamentary_work: Tuple[str, ...]
+
+
+class CompletenessFlags(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Completeness flags recorded by the extractor."""
+    all_articles_extracted: bool
+    footnotes_linked: bool
+    hierarchical_structure_complete: bool
+    metadata_complete: bool
+    is_minimal_document: bool
+    preamble_extracted: bool
+    is_abrogated_document: bool
+
+
+class ExtractionMetadata(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Extraction run information (extraction_metadata)."""
+    extraction_date: str
+    source_file: str
+    sections_included: Tuple[str, ...]
+    sections_excluded: Tuple[str, ...]
+    completeness_flags: CompletenessFlags
+
+
+class AbrogationInfo(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Abrogation of a fully abrogated document (empty for documents in force)."""
+    is_fully_abrogated: Union[bool, UnsetType] = UNSET
+    abrogation_text: Union[str, UnsetType] = UNSET
+    abrogating_law: Union[str, UnsetType] = UNSET
+    abrogating_article: Union[str, UnsetType] = UNSET
+    abrogation_entry: Union[str, UnsetType] = UNSET
+    abrogation_date: Union[str, UnsetType] = UNSET
+    raw_abrogation_text: Union[str, UnsetType] = UNSET
+
+
+class Document(msgspec.Struct, frozen=True, gc=False, forbid_unknown_fields=True):
+    """Complete hardcoded document, mirroring the MD8 JSON output."""
+    document_metadata: DocumentMetadata
+    preamble: str
+    abrogation_info: AbrogationInfo
+    document_hierarchy: Tuple[Node, ...]
+    references: References
+    external_links: ExternalLinks
+    extraction_metadata: ExtractionMetadata